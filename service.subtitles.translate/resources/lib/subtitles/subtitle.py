@@ -26,22 +26,47 @@ logger = logging.getLogger('.'.join((utils.logger_id, __name__.split('.', 2)[-1]
 # If group 4 has content the regex matched text not enclosed in tags
 # If groups 1-3 have content, group 1 contains the opening tag, group2 the actual text and group 3 the closing tag.
 # The regex is lenient with regard to extra white space within tags.
-line_regex = re.compile(r'(<\s*font[^>]*>)(?:<\s*[^/f][^>]*>)?(.*?)(?:<\s*/[^f][^>]*>)?((?(1)<\s*/font\s*)+>)|(?:^|(?<=>))([^<>]+)')
+# Group 3 is only reachable when group 1 matched, so the closing tag doesn't need a
+# conditional reference to group 1.
+# Markup is plain ASCII, so the pattern is compiled with re.ASCII. This only affects how
+# `\s` is matched within tags; captured text is returned as is.
+_LINE_FLAGS = re.ASCII
+# The alternative of line_regex that matches text outside font tags (group 4).
+_PLAIN_PATTERN = r'(?:^|(?<=>))([^<>]+)'
+line_regex = re.compile(r'(<\s*font[^>]*>)(?:<\s*[^/f][^>]*>)?(.*?)(?:<\s*/[^f][^>]*>)?((?:<\s*/font\s*)+>)|'
+                        + _PLAIN_PATTERN,
+                        _LINE_FLAGS)
+_line_finditer = line_regex.finditer
+# Used on lines that have markup, but no font tag, where the first alternative of
+# line_regex can never match.
+_plain_finditer = re.compile(_PLAIN_PATTERN, _LINE_FLAGS).finditer
 
 
 # line_regex = re.compile(r'((?:<\s*[^/][^>]*>)+)(.*?)((?:<\s*/[\w]+>)+)|([^<]+)')
 #?:<\s*[^/f][^>]*>)?(<\s*font[^>]*>)(?:<\s*[^/f][^>]*>)?(.*?)(?:<\s*/[^f][^>]*>)?((?(1)<\s*/font\s*)+>)(?:<\s*/[^f][^>]*>)?|(?:^|(?<=>))([^<>]+)
 
+# Regex to parse the time line of an srt block. Accepts both ',' and '.' as decimal separator,
+# as well as times without fraction. Anything else on the line, like position coordinates,
+# is not accepted.
+time_line_regex = re.compile(r'\s*(\d+):(\d+):(\d+)(?:[,.](\d*))?\s*-->\s*(\d+):(\d+):(\d+)(?:[,.](\d*))?\s*',
+                             re.ASCII)
+_time_line_match = time_line_regex.fullmatch
+
 
 class SrtFrase:
+    # A document consists of many small objects; slots save the memory of a dict per instance.
+    __slots__ = ('_ignore_col', '_open_tags', '_text', '_closing_tags', '_cached')
+
     def __init__(self, text: str,
                  open_tags: str | None,
                  closing_tags: str | None,
                  ignore_colours: bool = False):
         self._ignore_col = ignore_colours
-        self.open_tags = open_tags or ''
+        self._open_tags = open_tags or ''
         self._text = text.strip()
-        self.closing_tags = closing_tags or ''
+        self._closing_tags = closing_tags or ''
+        # The string representation is cached; every setter below clears the cache.
+        self._cached = None
 
     @property
     def text(self):
@@ -50,36 +75,79 @@ class SrtFrase:
     @text.setter
     def text(self, value):
         self._text = value
+        self._cached = None
+
+    @property
+    def open_tags(self):
+        return self._open_tags
+
+    @open_tags.setter
+    def open_tags(self, value):
+        self._open_tags = value or ''
+        self._cached = None
+
+    @property
+    def closing_tags(self):
+        return self._closing_tags
+
+    @closing_tags.setter
+    def closing_tags(self, value):
+        self._closing_tags = value or ''
+        self._cached = None
 
     def __str__(self):
+        if self._cached is not None:
+            return self._cached
         if self._text:
             if self._ignore_col:
-                return self._text
+                result = self._text
             else:
-                return ''.join((self.open_tags, self._text, self.closing_tags))
+                result = ''.join((self._open_tags, self._text, self._closing_tags))
         else:
-            return ''
+            result = ''
+        self._cached = result
+        return result
 
     def __bool__(self):
         return bool(self._text)
 
 
 class SrtLine:
+    __slots__ = ('_ignore_col', '_frases')
+
     def __init__(self, text, ignore_colours=False):
         self._ignore_col = ignore_colours
         self._frases = []
         self._parse_text(text, ignore_colours)
 
     def _parse_text(self, text, ignor_col):
-        for match in line_regex.finditer(text):
-            text = match.group(4) or match.group(2)
+        # Most lines have no markup at all; those don't need the regex.
+        # A stray '>' splits text into separate frases, so that needs the regex too.
+        if '<' not in text and '>' not in text:
             text = text.strip()
             if text:
-                self._frases.append((SrtFrase(text, match.group(1), match.group(3), ignor_col)))
+                self._frases.append(SrtFrase(text, '', '', ignor_col))
+            return
+
+        # Bind to locals; this runs for every line in the document.
+        append = self._frases.append
+        frase_cls = SrtFrase
+        if 'font' not in text:
+            for match in _plain_finditer(text):
+                text = match.group(1).strip()
+                if text:
+                    append(frase_cls(text, '', '', ignor_col))
+            return
+
+        for match in _line_finditer(text):
+            open_tag, tagged_text, close_tag, plain_text = match.groups()
+            text = (plain_text or tagged_text).strip()
+            if text:
+                append(frase_cls(text, open_tag, close_tag, ignor_col))
 
     def __str__(self):
         if self._frases:
-            return ' '.join(str(frase) for frase in self._frases)
+            return ' '.join([str(frase) for frase in self._frases])
         else:
             return ''
 
@@ -91,6 +159,8 @@ class SrtLine:
 
 
 class SrtBlock:
+    __slots__ = ('idx', 'start_time', 'end_time', 'lines')
+
     def __init__(self, block_str, ignore_colours=False):
         self.idx = ''
         self.start_time = None
@@ -99,27 +169,36 @@ class SrtBlock:
         self._parse(block_str, ignore_colours)
 
     def _parse(self, block_str: str, no_col):
-        lines = block_str.strip().split('\n')
-        try:
-            self.idx = lines[0]
-            self._parse_time_line(lines[1])
-            for line in lines[2:]:
-                line_obj = SrtLine(line.strip(), ignore_colours=no_col)
-                if line_obj:
-                    self.lines.append(line_obj)
-        except IndexError:
+        block_str = block_str.strip()
+        idx_end = block_str.find('\n')
+        if idx_end < 0:
+            # A block with only an index, or nothing at all.
+            self.idx = block_str
+            return
+        self.idx = block_str[:idx_end]
+        time_end = block_str.find('\n', idx_end + 1)
+        if time_end < 0:
             # A block with index, (possibly empty) time, but no text. Does happen...
-            pass
+            self._parse_time_line(block_str[idx_end + 1:])
+            return
+        self._parse_time_line(block_str[idx_end + 1:time_end])
+        append = self.lines.append
+        for line in block_str[time_end + 1:].split('\n'):
+            line_obj = SrtLine(line.strip(), ignore_colours=no_col)
+            if line_obj:
+                append(line_obj)
 
     def _parse_time_line(self, time_line):
-        start_str, end_str = time_line.split("-->")
-        self.start_time = self._parse_time(start_str)
-        self.end_time = self._parse_time(end_str)
+        """Parse a line formatted as '%H:%M:%S,%f --> %H:%M:%S,%f' into start and end
+        time in seconds.
 
-    def _parse_time(self, time_str: str) -> float:
-        """Take a string formatted as %H:%M:%s.%f and return the number of seconds"""
-        hours, minutes, second = time_str.replace(',', '.').split(':')
-        return int(hours) * 3600 + int(minutes) * 60 + float(second)
+        """
+        match = _time_line_match(time_line)
+        if match is None:
+            raise ValueError("Invalid time line '{}'".format(time_line))
+        st_h, st_m, st_s, st_f, et_h, et_m, et_s, et_f = match.groups('0')
+        self.start_time = int(st_h) * 3600 + int(st_m) * 60 + float(st_s + '.' + st_f)
+        self.end_time = int(et_h) * 3600 + int(et_m) * 60 + float(et_s + '.' + et_f)
 
     def _format_time_line(self):
         st = self.start_time
@@ -129,7 +208,7 @@ class SrtBlock:
 
     def __str__(self):
         if self:
-            return '\n'.join((self.idx, self._format_time_line(), *(str(line) for line in self.lines if line), '\n'))
+            return '\n'.join([self.idx, self._format_time_line(), *[str(line) for line in self.lines if line], '\n'])
         else:
             return ''
 
@@ -140,10 +219,66 @@ class SrtBlock:
     def __bool__(self):
         return bool(self.lines)
 
+
+def _split_doc(srt_doc: str):
+    """Generator that yields the text of each block in the string `srt_doc`.
+
+    Scans for block boundaries rather than split the document, so only one
+    block's text is held next to the original document at any time.
+
+    """
+    find = srt_doc.find
+    doc_len = len(srt_doc)
+    pos = 0
+    while pos < doc_len:
+        end = find('\n\n', pos)
+        if end < 0:
+            end = doc_len
+        if end > pos:
+            yield srt_doc[pos:end]
+        pos = end + 2
+
+
+def _split_stream(fp):
+    """Generator that yields the text of each block read from the lines of `fp`."""
+    buf = []
+    for line in fp:
+        if line == '\n':
+            if buf:
+                yield ''.join(buf)
+                buf.clear()
+        else:
+            buf.append(line)
+    if buf:
+        yield ''.join(buf)
+
+
+def _blocks_from_chunks(chunks, ignore_colours):
+    """Generator that parses each text chunk into an SrtBlock and yields the
+    blocks that have text.
+
+    """
+    for chunk in chunks:
+        block = SrtBlock(chunk, ignore_colours)
+        if block:
+            yield block
+
+
 class SrtDoc:
     def __init__(self, srt_doc: str, ignore_colours=False):
-        blocks = srt_doc.split('\n\n')
-        self.blocks = list(filter(bool, (SrtBlock(block, ignore_colours) for block in blocks if block)))
+        self.blocks = list(_blocks_from_chunks(_split_doc(srt_doc), ignore_colours))
+
+    @classmethod
+    def from_stream(cls, fp, ignore_colours=False):
+        """Create an SrtDoc from a file object, or any other iterable of lines.
+
+        Blocks are parsed while the lines are read, so the whole document
+        never has to be in memory as a single string.
+
+        """
+        doc = cls.__new__(cls)
+        doc.blocks = list(_blocks_from_chunks(_split_stream(fp), ignore_colours))
+        return doc
 
     @property
     def text(self):
@@ -155,16 +290,11 @@ class SrtDoc:
             orig.text = trans
 
     def __str__(self):
-        def block_iter():
-            # re-index and return all non-empty blocks as string
-            idx = 1
-            for block in self.blocks:
-                if block:
-                    block.idx = str(idx)
-                    idx += 1
-                    yield str(block)
-
-        return ''.join(block_str for block_str in block_iter())
+        # re-index and return all non-empty blocks as string
+        blocks = [block for block in self.blocks if block]
+        for idx, block in enumerate(blocks, 1):
+            block.idx = str(idx)
+        return ''.join([str(block) for block in blocks])
 
     def frases(self):
         """Generator that iterates over all frases in the document."""
@@ -180,6 +310,7 @@ class SrtDoc:
         `display_time`, stretch the time the first block is shown to fill the gap.
 
         """
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         blocks_iter = iter(self.blocks)
         b1 = next(blocks_iter)
         for b2 in blocks_iter:
@@ -190,6 +321,7 @@ class SrtDoc:
             if st > et:
                 new_end_t = min(b1.start_time + display_time, st)
                 b1.end_time = new_end_t
-                logger.debug("stretched display endTime from %02.0f:%02.0f:%06.3f to %02.0f:%02.0f:%06.3f",
-                             et/3600, (et%3600)/60, et%60, new_end_t/3600, (new_end_t%3600)/60, new_end_t%60)
+                if debug_enabled:
+                    logger.debug("stretched display endTime from %02.0f:%02.0f:%06.3f to %02.0f:%02.0f:%06.3f",
+                                 et/3600, (et%3600)/60, et%60, new_end_t/3600, (new_end_t%3600)/60, new_end_t%60)
             b1 = b2
\ No newline at end of file
@@ -20,31 +20,66 @@ logger = addon_log.logging.getLogger('.'.join((utils.logger_id, __name__.split('
 INDENT = ' ' * 60
 
 
+class SettingsMonitor(Monitor):
+    """Monitor that calls `on_settings_changed` whenever the addon's settings have changed."""
+    def __init__(self, on_settings_changed):
+        super(SettingsMonitor, self).__init__()
+        self._on_settings_changed = on_settings_changed
+
+    def onSettingsChanged(self) -> None:
+        self._on_settings_changed()
+
+
 class PlayerMonitor(Player):
     def __init__(self):
         super(PlayerMonitor, self).__init__()
-        self.monitor = Monitor()
+        self.monitor = SettingsMonitor(self.invalidate_settings)
         self._cur_file = None
+        self._cached_settings = None
+
+    def invalidate_settings(self) -> None:
+        logger.debug("Settings changed, cached settings invalidated.")
+        self._cached_settings = None
+
+    def _get_settings(self) -> dict:
+        """Return the settings used on playback.
+
+        Settings are read only once and kept until they change, instead of
+        getting a new Addon instance and querying Kodi on every video started.
+
+        """
+        settings = self._cached_settings
+        if settings is None:
+            # An Addon object holds a snapshot of the settings, get a new one to read the current values.
+            utils.addon_info.initialise()
+            addon = utils.addon_info.addon
+            settings = self._cached_settings = {
+                'subtitles_translate': addon.getSettingBool('subtitles_translate'),
+                'display_time': addon.getSettingNumber('display_time')
+            }
+        return settings
 
     def onAVStarted(self) -> None:
         # noinspection PyBroadException
-        logger.debug("onAVStarted, playing file\n"
-                     "%s file: %s\n"
-                     "%s video streams: %s\n"
-                     "%s audio streams: %s\n"
-                     "%s subtitles: %s",
-                     INDENT, self.getPlayingFile(),
-                     INDENT, self.getAvailableVideoStreams(),
-                     INDENT, self.getAvailableAudioStreams(),
-                     INDENT, self.getSubtitles())
+        # Querying the player is a call into Kodi; don't do that only to throw the result away.
+        if logger.isEnabledFor(addon_log.logging.DEBUG):
+            logger.debug("onAVStarted, playing file\n"
+                         "%s file: %s\n"
+                         "%s video streams: %s\n"
+                         "%s audio streams: %s\n"
+                         "%s subtitles: %s",
+                         INDENT, self.getPlayingFile(),
+                         INDENT, self.getAvailableVideoStreams(),
+                         INDENT, self.getAvailableAudioStreams(),
+                         INDENT, self.getSubtitles())
 
         li = self.getPlayingItem()
         file_name = li.getProperty('subtitles.translate.file')
         if not file_name:
             return
 
-        utils.addon_info.initialise()
-        if not utils.addon_info.addon.getSettingBool('subtitles_translate'):
+        settings = self._get_settings()
+        if not settings['subtitles_translate']:
             logger.debug("Automatic translation disabled in settings.")
             return
 
@@ -75,7 +110,7 @@ class PlayerMonitor(Player):
 
         # Strip the querystring from the video url, because it may contain items unique to every instance played.
         video_file = self.getPlayingFile().split('?')[0]
-        preferred_display_time = utils.addon_info.addon.getSettingNumber('display_time')
+        preferred_display_time = settings['display_time']
 
         logger.info("Subtitles file: '%s'", file_name)
         logger.info("Subtitles type: '%s'", subs_type)
@@ -8,6 +8,7 @@
 from test.support import fixtures
 fixtures.global_setup()
 
+import io
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +17,35 @@ from resources.lib.subtitles import subtitle
 from test.support.testutils import open_doc
 
 
+class TestFrase(unittest.TestCase):
+    def test_str_follows_text(self):
+        frase = subtitle.SrtFrase('This is text', '<font color="cyan">', '</font>')
+        self.assertEqual('<font color="cyan">This is text</font>', str(frase))
+        frase.text = 'Other text'
+        self.assertEqual('<font color="cyan">Other text</font>', str(frase))
+        frase.text = ''
+        self.assertEqual('', str(frase))
+
+    def test_str_follows_tags(self):
+        frase = subtitle.SrtFrase('This is text', '<font color="cyan">', '</font>')
+        self.assertEqual('<font color="cyan">This is text</font>', str(frase))
+        frase.open_tags = '<font color="red">'
+        self.assertEqual('<font color="red">This is text</font>', str(frase))
+        frase.closing_tags = None
+        self.assertEqual('', frase.closing_tags)
+        self.assertEqual('<font color="red">This is text', str(frase))
+
+    def test_str_ignore_colours(self):
+        frase = subtitle.SrtFrase('This is text', '<font color="cyan">', '</font>', ignore_colours=True)
+        self.assertEqual('This is text', str(frase))
+        frase.text = 'Other text'
+        self.assertEqual('Other text', str(frase))
+        frase.open_tags = '<font color="red">'
+        self.assertEqual('Other text', str(frase))
+        frase.text = ''
+        self.assertEqual('', str(frase))
+
+
 class TestLine(unittest.TestCase):
     def test_text_line(self):
         txt = 'This is text'
@@ -73,6 +103,15 @@ class TestLine(unittest.TestCase):
         self.assertEqual('This is text', frase.text)
         self.assertEqual('', frase.closing_tags)
 
+    def test_markup_with_stray_closing_bracket(self):
+        frases = subtitle.SrtLine('<i>a</i> > b')._frases
+        self.assertEqual(2, len(frases))
+        self.assertEqual('a', frases[0].text)
+        self.assertEqual('b', frases[1].text)
+        for frase in frases:
+            self.assertEqual('', frase.open_tags)
+            self.assertEqual('', frase.closing_tags)
+
     def test_empty_line(self):
         line = subtitle.SrtLine('')
         self.assertEqual(0, len(line._frases))
@@ -118,6 +157,28 @@ class TestSrtBlock(unittest.TestCase):
         self.assertEqual(10 * 3600 + 13 * 60 + 20.9, b.start_time)
         self.assertEqual(2 * 3600 + 3 * 60 + 22.60, b.end_time)
 
+    def test_parse_time_line_with_dot_separator(self):
+        b = subtitle.SrtBlock('')
+        b._parse_time_line('00:03:02.961 --> 00:03:04.5')
+        self.assertEqual(3 * 60 + 2.961, b.start_time)
+        self.assertEqual(3 * 60 + 4.5, b.end_time)
+
+    def test_parse_time_line_without_fraction(self):
+        b = subtitle.SrtBlock('')
+        b._parse_time_line('00:03:02 --> 00:03:04,')
+        self.assertEqual(3 * 60 + 2, b.start_time)
+        self.assertEqual(3 * 60 + 4, b.end_time)
+        b._parse_time_line(' 00:03:02-->00:03:04 ')
+        self.assertEqual(3 * 60 + 2, b.start_time)
+        self.assertEqual(3 * 60 + 4, b.end_time)
+
+    def test_parse_invalid_time_line(self):
+        b = subtitle.SrtBlock('')
+        self.assertRaises(ValueError, b._parse_time_line, '00:00:01,000 --> 00:00:02,000 X1:10')
+        self.assertRaises(ValueError, b._parse_time_line, '00:00:01,000')
+        self.assertRaises(ValueError, b._parse_time_line, '00:01 --> 00:02')
+        self.assertRaises(ValueError, subtitle.SrtBlock, '1\n 00:00:01,000-->00:00:02,000 X1:10\ntext')
+
     def test_format_time_line(self):
         b = subtitle.SrtBlock('')
         b.start_time = 10 * 3600 + 11 * 60 + 21.9
@@ -139,6 +200,11 @@ class TestSrtDoc(unittest.TestCase):
     def test_create_doc(self):
         srt = subtitle.SrtDoc(open_doc('srt/spy_among_friends.en.srt')())
 
+    def test_create_doc_from_stream(self):
+        srt_txt = open_doc('srt/spy_among_friends.en.srt')()
+        srt = subtitle.SrtDoc.from_stream(io.StringIO(srt_txt))
+        self.assertEqual(str(subtitle.SrtDoc(srt_txt)), str(srt))
+
     def test_stretch_time(self):
         srt = subtitle.SrtDoc(open_doc('srt/spy_among_friends.en.srt')())
         srt.stretch_time(7)